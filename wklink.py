@@ -21,20 +21,23 @@ How it works:
 Works with iambic paddles, bugs, and straight keys.
 """
 
+import collections
+import functools
+import os
+import re
+import select
+import sys
 import tkinter as tk
 from tkinter import ttk, scrolledtext
 import serial
 import serial.tools.list_ports
 import threading
-import queue
 import time
-from datetime import datetime
 
-try:
-    from pynput.keyboard import Key, Controller as KeyboardController
-    KEYBOARD_AVAILABLE = True
-except ImportError:
-    KEYBOARD_AVAILABLE = False
+# pynput is imported lazily (see _load_keyboard) — on Linux it drags in the
+# X11/evdev input stack and costs hundreds of ms before first paint.
+Key = None
+KeyboardController = None
 
 # ── Morse table ───────────────────────────────────────────────────────────────
 
@@ -49,6 +52,193 @@ MORSE = {
     '5': '.....', '6': '-....', '7': '--...', '8': '---..', '9': '----.',
 }
 
+# Per-character element table: char → tuple of (key, dit_units) pairs, so
+# the play path never re-parses pattern strings.  Filled by _load_keyboard.
+MORSE_KEYS = {}
+
+_kb_loaded = None   # None = not tried yet, then True/False
+
+
+def _load_keyboard():
+    """Import pynput and build MORSE_KEYS on first use.
+
+    Returns True when a keyboard backend is available.  The import is
+    deferred to the first connect so app start-up isn't taxed by pynput's
+    platform backends.
+    """
+    global _kb_loaded, Key, KeyboardController
+    if _kb_loaded is None:
+        try:
+            from pynput.keyboard import Key as _Key, Controller as _Controller
+        except ImportError:
+            _kb_loaded = False
+        else:
+            Key, KeyboardController = _Key, _Controller
+            MORSE_KEYS.update({
+                ch: tuple((Key.ctrl_l if s == '.' else Key.ctrl_r,
+                           1 if s == '.' else 3) for s in pat)
+                for ch, pat in MORSE.items()
+            })
+            _kb_loaded = True
+    return _kb_loaded
+
+
+# byte value → uppercase 1-char string, one index per echo byte
+# (bytes.upper touches only a-z, so the table stays 256 chars long)
+_ASCII_UPPER = bytes(range(256)).upper().decode('latin-1')
+
+# translate() tables for whole-buffer echo bursts: uppercase in C and
+# delete every byte whose uppercase form is neither a Morse char nor space
+_UP_TABLE = bytes(range(256)).upper()
+_ECHO_DELETE = bytes(b for b in range(256)
+                     if _ASCII_UPPER[b] != ' ' and _ASCII_UPPER[b] not in MORSE)
+
+# byte → uppercase char when it is playable (Morse char or space), else None —
+# folds the uppercase step and both membership tests into one index
+_ECHO_TABLE = tuple(c if c == ' ' or c in MORSE else None for c in _ASCII_UPPER)
+
+
+@functools.lru_cache(maxsize=64)
+def _schedule(char, wpm):
+    """Fully-resolved (key, press_sec, gap_sec) schedule for one character.
+
+    gap_sec is the 1-dit inter-element space; it is 0 on the last element
+    because no inter-character sleep is added — the WK echo cadence IS the
+    gap between characters.  Cached per (char, wpm); the cache is cleared
+    when the speed pot moves.
+    """
+    dit = 1.2 / wpm
+    elems = MORSE_KEYS.get(char, ())
+    last = len(elems) - 1
+    return tuple((key, units * dit, dit if i < last else 0.0)
+                 for i, (key, units) in enumerate(elems))
+
+
+class _WinCtrlInjector:
+    """Drop-in for pynput's Controller on Windows, limited to the two Ctrl keys.
+
+    pynput routes every press/release through its platform abstraction and
+    an internal lock — measurable, jittery overhead in the element timing
+    loop.  Here the four INPUT structs (Ctrl-L/R down/up) are built once and
+    each edge is a single user32.SendInput call.
+    """
+
+    def __init__(self):
+        import ctypes
+
+        ULONG_PTR = ctypes.c_size_t
+        INPUT_KEYBOARD  = 1
+        KEYEVENTF_KEYUP = 0x0002
+        VK_LCONTROL, VK_RCONTROL = 0xA2, 0xA3
+
+        class KEYBDINPUT(ctypes.Structure):
+            _fields_ = (('wVk', ctypes.c_ushort), ('wScan', ctypes.c_ushort),
+                        ('dwFlags', ctypes.c_ulong), ('time', ctypes.c_ulong),
+                        ('dwExtraInfo', ULONG_PTR))
+
+        class INPUT(ctypes.Structure):
+            class _U(ctypes.Union):
+                # pad to the size of the largest INPUT union member
+                _fields_ = (('ki', KEYBDINPUT), ('pad', ctypes.c_ubyte * 32))
+            _anonymous_ = ('u',)
+            _fields_ = (('type', ctypes.c_ulong), ('u', _U))
+
+        def make(vk, flags):
+            inp = INPUT(type=INPUT_KEYBOARD)
+            inp.ki = KEYBDINPUT(wVk=vk, wScan=0, dwFlags=flags,
+                                time=0, dwExtraInfo=0)
+            return inp
+
+        self._size  = ctypes.sizeof(INPUT)
+        self._byref = ctypes.byref
+        self._send  = ctypes.WinDLL('user32').SendInput
+        self._down  = {Key.ctrl_l: make(VK_LCONTROL, 0),
+                       Key.ctrl_r: make(VK_RCONTROL, 0)}
+        self._up    = {Key.ctrl_l: make(VK_LCONTROL, KEYEVENTF_KEYUP),
+                       Key.ctrl_r: make(VK_RCONTROL, KEYEVENTF_KEYUP)}
+
+    def press(self, key):
+        self._send(1, self._byref(self._down[key]), self._size)
+
+    def release(self, key):
+        self._send(1, self._byref(self._up[key]), self._size)
+
+
+class _HotState:
+    """State shared between the Tk thread and the reader's timing loops.
+
+    A __slots__ holder so the per-byte/per-element paths pay a fixed-offset
+    attribute load instead of probing a tk.Tk instance dict with hundreds
+    of entries; the hot loops bind it to a local once.
+    """
+    __slots__ = ('connected', 'held_key', 'dit_state', 'dah_state')
+
+    def __init__(self):
+        self.connected = False
+        self.held_key  = None      # key object currently pressed, if any
+        self.dit_state = 0         # indicator ints polled by _ui_tick
+        self.dah_state = 0
+
+
+def _sleep_until(deadline):
+    """Sleep to an absolute perf_counter deadline, busy-spinning the tail.
+
+    Plain time.sleep is at the mercy of OS timer granularity (~15.6 ms by
+    default on Windows) — fatal for 30 ms dits.  Sleep until ~2 ms before
+    the deadline, then spin on perf_counter for the remainder, keeping
+    element durations within a fraction of a millisecond of target.
+    """
+    remaining = deadline - time.perf_counter()
+    if remaining > 0.002:
+        time.sleep(remaining - 0.002)
+    while time.perf_counter() < deadline:
+        pass
+
+
+def _make_player(app, wpm):
+    """Build a play(char) closure specialized for one WPM.
+
+    Time constants, schedules, key objects, bound keyboard methods and
+    indicator callbacks are all resolved here, once per pot change, so the
+    per-element loop touches nothing but locals.  Regenerated from
+    _handle_pot whenever the speed actually changes.
+    """
+    press, release = app.kb.press, app.kb.release
+    sleep_until, now, set_state = _sleep_until, time.perf_counter, setattr
+    dit_key = Key.ctrl_l
+
+    # Element entries carry the indicator-state attribute they drive, so
+    # the loop body is identical for dits and dahs — no per-element
+    # branching and no Tk traffic (the 30 Hz UI poller picks the ints up).
+    table = {
+        ch: tuple((key, press_sec, gap_sec,
+                   'dit_state' if key is dit_key else 'dah_state')
+                  for key, press_sec, gap_sec in _schedule(ch, wpm))
+        for ch in MORSE
+    }
+    hot = app._hot
+
+    def play(char):
+        # Absolute perf_counter deadlines — scheduler slop doesn't
+        # accumulate across elements (see _schedule for gap semantics)
+        t = now()
+        for key, press_sec, gap_sec, state_attr in table[char]:
+            if not hot.connected:
+                break
+            hot.held_key = key
+            press(key)
+            set_state(hot, state_attr, 1)
+            t += press_sec
+            sleep_until(t)
+            release(key)
+            hot.held_key = None
+            set_state(hot, state_attr, 0)
+            if gap_sec:
+                t += gap_sec
+                sleep_until(t)
+
+    return play
+
 # ── WinKeyer protocol constants ───────────────────────────────────────────────
 
 WK_BAUD         = 1200
@@ -68,14 +258,30 @@ WK_SET_SIDETONE = 0x01
 WK_MODE_BASE = 0xC0   # PDY=1 | PECHO=1
 WK_MODE_SWAP = 0xC8   # WK_MODE_BASE | bit 3
 
-# Byte-type identification
-def is_status_byte(b): return (b & 0xC0) == 0xC0   # 0xC0–0xFF
-def is_pot_byte(b):    return (b & 0xC0) == 0x80   # 0x80–0xBF
+# Prebuilt two-byte command frames — constant, so built once here instead
+# of bytes([...]) on every write
+WK_FRAME_MODE_BASE = bytes((WK_SET_MODE_CMD, WK_MODE_BASE))
+WK_FRAME_MODE_SWAP = bytes((WK_SET_MODE_CMD, WK_MODE_SWAP))
+WK_FRAME_TONE_MUTE = bytes((WK_SET_SIDETONE, 0x00))
+WK_FRAME_TONE_1KHZ = bytes((WK_SET_SIDETONE, 0x04))
 
+# Byte-type identification by the top two bits (dispatch indexes on b >> 6):
+#   (b & 0xC0) == 0xC0 → status byte (0xC0–0xFF)
+#   (b & 0xC0) == 0x80 → pot byte    (0x80–0xBF)
+#   otherwise          → PECHO ASCII (0x00–0x7F)
 
-def pot_to_wpm(b, min_wpm=5, range_wpm=50):
-    """Lower 5 bits of a pot byte (0–31) mapped to min_wpm..min_wpm+range_wpm."""
-    return min_wpm + round((b & 0x1F) * range_wpm / 31)
+
+# USB-serial bridge chips WinKeyers usually sit behind — used to pick the
+# most likely port when several are present
+_PREF_RE = re.compile(r'FTDI|WinKey|CH340|Silicon')
+
+# Lower 5 bits of a pot byte (0–31) mapped to 5..55 WPM, precomputed once
+_POT_TABLE = tuple(5 + round(i * 50 / 31) for i in range(32))
+
+
+def pot_to_wpm(b):
+    """WPM for a pot byte — a table index, no per-byte arithmetic."""
+    return _POT_TABLE[b & 0x1F]
 
 
 # ── Application ───────────────────────────────────────────────────────────────
@@ -100,32 +306,49 @@ class WKLink(tk.Tk):
         self.configure(bg=self.BG)
         self.resizable(False, False)
 
-        # Connection state
+        # Connection state (hot fields live in _HotState; `connected` and
+        # the indicator ints are properties over it for the cold paths)
+        self._hot        = _HotState()
         self.serial_port = None
         self.read_thread = None
-        self.send_thread = None
-        self.connected   = False
         self.current_wpm = 20       # default until pot byte arrives
+        self._wpm_staged = None     # latest pot value, staged for the UI tick
+        self._last_wpm_shown = None # last value painted on the WPM label
+        self._ts_cache = (0, '')    # (unix second, formatted HH:MM:SS)
 
-        # VBand forwarding queue
-        self.send_queue  = queue.Queue()
+        # Decoded-character display batching: the reader thread appends here
+        # and the 30 Hz _ui_tick drains it in one insert.  Bounded so a
+        # stalled UI can never grow it without limit.
+        self._log_pending = collections.deque(maxlen=512)
+        self._inserts_since_trim = 0
 
-        # Held-key tracking (safety release only)
-        self._dit_held = False
-        self._dah_held = False
+        # Last indicator values painted by the 30 Hz _ui_tick poller
+        self._dit_shown = self._dah_shown = 0
 
         # Settings
         self.mute_sidetone = tk.BooleanVar(value=True)
         self.always_on_top = tk.BooleanVar(value=True)
         self.swap_paddles  = tk.BooleanVar(value=False)
 
-        self.kb = KeyboardController() if KEYBOARD_AVAILABLE else None
+        # Keyboard backend and per-WPM play closure are created on first
+        # connect (_init_keyboard) so pynput never loads before first paint
+        self.kb = None
+        self._play = None
 
         self._build_ui()
         self._scan_ports()
         self._apply_always_on_top()
+        self._ui_tick()
         self.protocol('WM_DELETE_WINDOW', self._on_close)
 
+    @property
+    def connected(self):
+        return self._hot.connected
+
+    @connected.setter
+    def connected(self, value):
+        self._hot.connected = value
+
     # ── UI construction ───────────────────────────────────────────────────────
 
     def _build_ui(self):
@@ -219,6 +442,10 @@ class WKLink(tk.Tk):
             wrap='word', state='disabled',
             highlightbackground=self.BORDER, highlightthickness=1)
         self.log_box.pack(fill='both', expand=True, pady=(2, 0))
+        self.log_box.tag_config('dec', foreground=self.GREEN,
+                                font=('Consolas', 11, 'bold'))
+        self.log_box.tag_config('info', foreground=self.DIM_GREEN)
+        self.log_box.tag_config('err', foreground=self.RED)
 
         # ── Footer ────────────────────────────────────────────────────────
         footer = tk.Frame(self, bg=self.BG)
@@ -238,7 +465,11 @@ class WKLink(tk.Tk):
 
     def _style_combobox(self):
         s = ttk.Style()
-        s.theme_use('clam')
+        try:
+            if s.theme_use() != 'clam':
+                s.theme_use('clam')
+        except tk.TclError:
+            pass
         s.configure('TCombobox',
                     fieldbackground=self.PANEL, background=self.PANEL,
                     foreground=self.GREEN, selectbackground=self.BORDER,
@@ -261,8 +492,7 @@ class WKLink(tk.Tk):
         if devices:
             best = next(
                 (p.device for p in ports
-                 if any(kw in (p.description or '')
-                        for kw in ('FTDI', 'WinKey', 'CH340', 'Silicon'))),
+                 if p.description and _PREF_RE.search(p.description)),
                 devices[0])
             self.port_var.set(best)
         self._log(f'Found {len(devices)} serial port(s)')
@@ -280,8 +510,14 @@ class WKLink(tk.Tk):
         if not port:
             self._log('ERROR: no port selected', error=True)
             return
+        self._init_keyboard()
         try:
-            self.serial_port = serial.Serial(port, WK_BAUD, timeout=0.05)
+            # exclusive: fail fast with a clear error if another program
+            # (flrig, a second WKLink, ...) already holds the port, instead
+            # of both processes stealing bytes from the same WK stream
+            self.serial_port = serial.Serial(port, WK_BAUD, timeout=0.05,
+                                             exclusive=True)
+            self._set_low_latency()
             time.sleep(0.3)
             self.serial_port.reset_input_buffer()
 
@@ -291,39 +527,33 @@ class WKLink(tk.Tk):
             self.serial_port.reset_input_buffer()
             self.serial_port.write(WK_HOST_OPEN)
 
-            # Wait for version byte(s)
-            deadline = time.time() + 1.5
-            resp = b''
-            while time.time() < deadline:
-                chunk = self.serial_port.read(4)
-                if chunk:
-                    resp += chunk
-                if len(resp) >= 2:
-                    break
-                time.sleep(0.01)
+            # Wait for version byte(s) — one blocking read instead of polling
+            old_timeout = self.serial_port.timeout
+            self.serial_port.timeout = 1.5
+            resp = self.serial_port.read(2)
+            self.serial_port.timeout = old_timeout
+
+            self._tune_comm_timeouts()
 
             ver = next((b for b in resp if 0x10 <= b <= 0x40), None)
             self._log(f'WinKeyer v{ver} connected' if ver else 'WinKeyer open (version unknown)')
 
             # Mode: paddle watchdog off, PECHO on, iambic B
-            mode = WK_MODE_SWAP if self.swap_paddles.get() else WK_MODE_BASE
-            self.serial_port.write(bytes([WK_SET_MODE_CMD, mode]))
+            mode = WK_FRAME_MODE_SWAP if self.swap_paddles.get() else WK_FRAME_MODE_BASE
+            self.serial_port.write(mode)
             time.sleep(0.05)
 
             if self.mute_sidetone.get():
-                self.serial_port.write(bytes([WK_SET_SIDETONE, 0x00]))
+                self.serial_port.write(WK_FRAME_TONE_MUTE)
             time.sleep(0.05)
 
-            self.connected  = True
-            self._dit_held  = False
-            self._dah_held  = False
+            self.connected      = True
+            self._hot.held_key  = None
+            self._set_timer_resolution(True)
 
-            # Drain the send queue in case anything is left from a previous session
-            while not self.send_queue.empty():
-                try:
-                    self.send_queue.get_nowait()
-                except queue.Empty:
-                    break
+            # Byte dispatch by top two bits: 00/01 → echo, 10 → pot, 11 → status
+            self._dispatch = (self._handle_echo, self._handle_echo,
+                              self._handle_pot, self._handle_status)
 
             self._set_status(True)
             self.connect_btn.config(text='DISCONNECT', fg=self.RED)
@@ -331,24 +561,140 @@ class WKLink(tk.Tk):
             self.read_thread = threading.Thread(target=self._read_loop, daemon=True)
             self.read_thread.start()
 
-            self.send_thread = threading.Thread(target=self._send_worker, daemon=True)
-            self.send_thread.start()
-
         except serial.SerialException as e:
             self._log(f'ERROR: {e}', error=True)
 
+    def _init_keyboard(self):
+        """Create the keyboard backend on first connect (lazy pynput import)."""
+        if self.kb is not None or not _load_keyboard():
+            return
+        self.kb = KeyboardController()
+        if sys.platform == 'win32':
+            try:
+                self.kb = _WinCtrlInjector()   # same press/release interface
+            except Exception:
+                pass                           # keep the pynput fallback
+        self._play = _make_player(self, max(5, self.current_wpm))
+
+    def _set_low_latency(self):
+        """Best-effort: drop the USB-serial latency timer from its 16 ms default.
+
+        FTDI/CH340 bridges hold received bytes up to the latency timer before
+        delivering them to the host, which at 1200 baud dominates the
+        echo→keypress delay.  Each step is optional — failures are ignored.
+        """
+        if sys.platform.startswith('linux'):
+            # /sys/bus/usb-serial/devices/ttyUSBx/latency_timer (FTDI only)
+            done = False
+            try:
+                dev = os.path.basename(self.serial_port.port)
+                with open(f'/sys/bus/usb-serial/devices/{dev}/latency_timer', 'w') as f:
+                    f.write('1')
+                done = True
+            except OSError:
+                pass
+            if not done:
+                # TIOCSSERIAL ASYNC_LOW_LATENCY: same effect without sysfs
+                # write permission
+                try:
+                    import fcntl
+                    import struct
+                    TIOCGSERIAL, TIOCSSERIAL = 0x541E, 0x541F
+                    ASYNC_LOW_LATENCY = 0x2000
+                    fd = self.serial_port.fileno()
+                    buf = bytearray(72)          # struct serial_struct
+                    fcntl.ioctl(fd, TIOCGSERIAL, buf)
+                    flags = struct.unpack_from('i', buf, 16)[0]  # .flags
+                    struct.pack_into('i', buf, 16, flags | ASYNC_LOW_LATENCY)
+                    fcntl.ioctl(fd, TIOCSSERIAL, buf)
+                    done = True
+                except Exception:
+                    pass
+            if done:
+                self._log('FTDI latency timer set to 1 ms')
+        elif sys.platform == 'win32':
+            try:
+                self.serial_port.set_buffer_size(rx_size=4096, tx_size=4096)
+            except Exception:
+                pass
+            # FTDI D2XX, if the driver DLL is around; the registry LatencyTimer
+            # default stays at 16 ms otherwise.
+            try:
+                import ctypes
+                ftd2xx = ctypes.WinDLL('ftd2xx')
+                handle = ctypes.c_void_p()
+                if ftd2xx.FT_Open(0, ctypes.byref(handle)) == 0:
+                    ftd2xx.FT_SetLatencyTimer(handle, 1)
+                    ftd2xx.FT_Close(handle)
+                    self._log('FTDI latency timer set to 1 ms')
+            except Exception:
+                pass
+
+    def _tune_comm_timeouts(self):
+        """Windows: return reads as soon as any byte is available.
+
+        pyserial's default COMMTIMEOUTS add interval slop on top of the
+        FTDI latency timer.  Applied after the version handshake — pyserial
+        rewrites COMMTIMEOUTS whenever the timeout property is assigned,
+        which would clobber an earlier tweak.
+        """
+        if sys.platform != 'win32':
+            return
+        try:
+            import ctypes
+            from serial import win32
+            timeouts = win32.COMMTIMEOUTS()
+            win32.GetCommTimeouts(self.serial_port._port_handle,
+                                  ctypes.byref(timeouts))
+            timeouts.ReadIntervalTimeout = 1
+            timeouts.ReadTotalTimeoutMultiplier = 0
+            win32.SetCommTimeouts(self.serial_port._port_handle,
+                                  ctypes.byref(timeouts))
+        except Exception:
+            pass
+
+    @staticmethod
+    def _boost_thread_priority():
+        """Best-effort: raise the calling thread's scheduling priority.
+
+        Run from the RX and send threads so the echo→keypress path
+        preempts the Tk mainloop rather than the other way around.
+        Silently keeps normal priority when elevation isn't permitted.
+        """
+        try:
+            if sys.platform == 'win32':
+                import ctypes
+                k32 = ctypes.WinDLL('kernel32')
+                k32.SetThreadPriority(k32.GetCurrentThread(), 15)  # TIME_CRITICAL
+            else:
+                try:
+                    os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(20))
+                except (PermissionError, OSError):
+                    os.nice(-10)
+        except Exception:
+            pass
+
+    def _set_timer_resolution(self, enable):
+        """Windows: request 1 ms scheduler granularity while connected."""
+        if sys.platform != 'win32':
+            return
+        try:
+            import ctypes
+            winmm = ctypes.WinDLL('winmm')
+            (winmm.timeBeginPeriod if enable else winmm.timeEndPeriod)(1)
+        except Exception:
+            pass
+
     def _disconnect(self):
         was_connected = self.connected
         self.connected = False
-
-        # Unblock the send worker so it can exit cleanly
-        self.send_queue.put(None)
+        self._set_timer_resolution(False)
 
         self._release_keys()
         try:
             if self.serial_port and self.serial_port.is_open:
                 if was_connected and self.mute_sidetone.get():
-                    self.serial_port.write(bytes([WK_SET_SIDETONE, 0x04]))  # restore 1000 Hz
+                    self.serial_port.write(WK_FRAME_TONE_1KHZ)  # restore 1000 Hz
                 self.serial_port.write(WK_HOST_CLOSE)
                 time.sleep(0.05)
                 self.serial_port.close()
@@ -357,29 +703,75 @@ class WKLink(tk.Tk):
 
         self._set_status(False)
         self.connect_btn.config(text='CONNECT', fg=self.GREEN)
-        self.after(0, lambda: self.dit_dot.config(fg=self.BORDER))
-        self.after(0, lambda: self.dah_dot.config(fg=self.BORDER))
+        self._hot.dit_state = self._hot.dah_state = 0   # poller clears the dots
         self._log('Disconnected')
 
     # ── Read loop ─────────────────────────────────────────────────────────────
 
     def _read_loop(self):
         """Background thread: reads WinKeyer bytes."""
-        while self.connected:
+        self._boost_thread_priority()
+
+        # The port and handlers don't change while connected — bind every
+        # name the per-byte path touches to a local once, outside the loop.
+        port = self.serial_port
+        read = port.read if port else None
+        readinto = port.readinto if port else None
+        dispatch = self._dispatch
+        echo_batch = self._handle_echo_batch
+        up_table, echo_delete = _UP_TABLE, _ECHO_DELETE
+
+        # Fixed ring of one USB-burst's worth of bytes: the drain lands via
+        # readinto, so a burst costs no per-byte object or buffer-concat
+        # allocations.
+        rx_buf = bytearray(256)
+        rx_mv = memoryview(rx_buf)
+
+        # On POSIX, park in select() until the fd is actually readable
+        # instead of churning 50 ms read timeouts while idle.
+        hot = self._hot
+        rx_fd = None
+        if port and os.name == 'posix':
+            try:
+                rx_fd = port.fileno()
+            except Exception:
+                rx_fd = None
+        sel = select.select
+
+        while hot.connected:
             try:
-                if not self.serial_port or not self.serial_port.is_open:
+                if not port or not port.is_open:
                     break
-                raw = self.serial_port.read(1)
+                if rx_fd is not None:
+                    readable, _, _ = sel([rx_fd], [], [], 0.5)
+                    if not readable:
+                        continue
+                # Block for the first byte, then drain whatever else has
+                # accumulated in one read — burst echo arrives as one syscall
+                # instead of one per byte.
+                raw = read(1)
                 if not raw:
                     continue
-                b = raw[0]
-                if is_status_byte(b):
-                    self._handle_status(b)
-                elif is_pot_byte(b):
-                    self._handle_pot(b)
+                rx_buf[0] = raw[0]
+                total = 1
+                n = port.in_waiting
+                if n:
+                    # bound by in_waiting so readinto returns immediately
+                    if n > 255:
+                        n = 255
+                    total += readinto(rx_mv[1:1 + n]) or 0
+                data = rx_mv[:total]
+                if max(data) < 0x80:
+                    # Pure PECHO burst (the common case while keying):
+                    # uppercase + filter the whole buffer in C
+                    clean = data.tobytes().translate(up_table, echo_delete)
+                    if clean:
+                        echo_batch(clean.decode('ascii'))
                 else:
-                    # PECHO: a decoded ASCII character — forward to VBand
-                    self._handle_echo(b)
+                    for b in data:
+                        # Top-two-bit classification straight into the handler:
+                        # PECHO (00/01), pot (10), or status (11)
+                        dispatch[b >> 6](b)
             except serial.SerialException:
                 break
             except Exception as e:
@@ -398,112 +790,128 @@ class WKLink(tk.Tk):
         pass  # nothing to do; safety key release is handled on disconnect
 
     def _handle_pot(self, b):
+        # Stage the value for the UI tick — this path never touches Tk, and
+        # WK repeats pot bytes even when the pot hasn't moved.
         wpm = pot_to_wpm(b)
-        self.current_wpm = wpm
-        self.after(0, lambda w=wpm: self.wpm_lbl.config(text=str(w)))
+        self._wpm_staged = wpm
+        if wpm != self.current_wpm:
+            self.current_wpm = wpm
+            _schedule.cache_clear()
+            if self.kb:
+                self._play = _make_player(self, wpm)
+
+    def _ui_tick(self):
+        """30 Hz repaint of everything the reader thread stages.
+
+        The hot paths only write plain ints (_HotState indicator state, the
+        staged WPM, the decoded-character deque); this poller diffs them
+        against what is on screen and repaints on change, so UI work is
+        O(1) per frame no matter the keying speed and neither the element
+        loop nor the pot handler ever touches Tk.
+        """
+        hot = self._hot
+        if hot.dit_state != self._dit_shown:
+            self._dit_shown = hot.dit_state
+            self.dit_dot.config(fg=self.GREEN if self._dit_shown else self.BORDER)
+        if hot.dah_state != self._dah_shown:
+            self._dah_shown = hot.dah_state
+            self.dah_dot.config(fg=self.AMBER if self._dah_shown else self.BORDER)
+        if self._wpm_staged is not None and self._wpm_staged != self._last_wpm_shown:
+            self._last_wpm_shown = self._wpm_staged
+            self.wpm_lbl.config(text=str(self._last_wpm_shown))
+        if self._log_pending:
+            self._flush_decoded()
+        self.after(33, self._ui_tick)
 
     def _handle_echo(self, b):
-        """PECHO decoded character — queue for VBand forwarding and log display."""
-        try:
-            char = chr(b).upper()
-            if char in MORSE:
-                self.send_queue.put(char)
-                self.after(0, lambda c=char: self._append_decoded(c))
-            elif char == ' ':
-                self.send_queue.put(' ')
-                self.after(0, lambda: self._append_decoded(' '))
-        except Exception:
-            pass
-
-    # ── VBand send worker ─────────────────────────────────────────────────────
-
-    def _send_worker(self):
-        """Forwards decoded characters to VBand as Ctrl keypresses.
-
-        Each element is held for its exact duration at current WPM.
-        No inter-character sleep is added — the natural gap between WK echo
-        bytes is the inter-character spacing.
-        """
-        while self.connected:
-            try:
-                char = self.send_queue.get(timeout=0.3)
-                if char is None:        # sentinel: shutdown signal
-                    break
-                if char == ' ':
-                    time.sleep(4 * (1.2 / max(5, self.current_wpm)))  # extra word gap
-                    continue
-                if self.kb and char in MORSE:
-                    self._play_char(char)
-            except queue.Empty:
+        """PECHO decoded character — play to VBand and queue for log display."""
+        char = _ECHO_TABLE[b]
+        if char is not None:
+            self._log_pending.append(char)
+            self._play_chars(char)
+
+    def _handle_echo_batch(self, chars):
+        """A burst of PECHO characters already uppercased and filtered in C."""
+        self._log_pending.extend(chars)
+        self._play_chars(chars)
+
+    # ── VBand forwarding ──────────────────────────────────────────────────────
+
+    def _play_chars(self, chars):
+        """Play decoded characters as Ctrl keypresses, directly on the read
+        thread — WK only echoes the next character after the current one
+        completes, so blocking here is natural back-pressure.  Runs of
+        spaces collapse into one sleep; no inter-character sleep is added,
+        the gap between WK echo bytes is the inter-character spacing."""
+        i, n = 0, len(chars)
+        while i < n:
+            c = chars[i]
+            if c == ' ':
+                k = 1
+                while i + k < n and chars[i + k] == ' ':
+                    k += 1
+                time.sleep(4 * (1.2 / max(5, self.current_wpm)) * k)  # word gap(s)
+                i += k
                 continue
-            except Exception:
-                pass
-
-        self._release_keys()
-
-    def _play_char(self, char):
-        """Simulate dit/dah Ctrl keypresses for one character at current WPM."""
-        wpm    = max(5, self.current_wpm)
-        dit    = 1.2 / wpm          # dit duration in seconds
-
-        pattern = MORSE.get(char, '')
-        for i, sym in enumerate(pattern):
-            if not self.connected:
-                break
-            if sym == '.':
-                self._dit_held = True
-                self.kb.press(Key.ctrl_l)
-                self.after(0, lambda: self.dit_dot.config(fg=self.GREEN))
-                time.sleep(dit)
-                self.kb.release(Key.ctrl_l)
-                self._dit_held = False
-                self.after(0, lambda: self.dit_dot.config(fg=self.BORDER))
-            else:
-                self._dah_held = True
-                self.kb.press(Key.ctrl_r)
-                self.after(0, lambda: self.dah_dot.config(fg=self.AMBER))
-                time.sleep(dit * 3)
-                self.kb.release(Key.ctrl_r)
-                self._dah_held = False
-                self.after(0, lambda: self.dah_dot.config(fg=self.BORDER))
-
-            # Inter-element space (1 dit) between elements within a character
-            if i < len(pattern) - 1:
-                time.sleep(dit)
-
-        # No inter-character sleep — WK echo timing provides the natural gap
+            if self._play and c in MORSE:
+                self._play(c)
+            i += 1
 
     def _release_keys(self):
-        """Safety: release any held Ctrl keys."""
+        """Safety: release a held Ctrl key."""
         if not self.kb:
             return
         try:
-            if self._dit_held:
-                self.kb.release(Key.ctrl_l)
-                self._dit_held = False
-            if self._dah_held:
-                self.kb.release(Key.ctrl_r)
-                self._dah_held = False
+            key, self._hot.held_key = self._hot.held_key, None
+            if key is not None:
+                self.kb.release(key)
         except Exception:
             pass
 
     # ── Logging ───────────────────────────────────────────────────────────────
 
+    def _ts(self):
+        """HH:MM:SS for the current second, re-formatted at most once a second."""
+        now = int(time.time())
+        if now != self._ts_cache[0]:
+            self._ts_cache = (now, time.strftime('%H:%M:%S', time.localtime(now)))
+        return self._ts_cache[1]
+
     def _log(self, msg, error=False):
-        ts = datetime.now().strftime('%H:%M:%S')
-        fg = self.RED if error else self.DIM_GREEN
+        ts = self._ts()
         self.log_box.config(state='normal')
-        self.log_box.insert('end', f'\n[{ts}] {msg}', ('ev',))
-        self.log_box.tag_config('ev', foreground=fg)
+        self.log_box.insert('end', f'\n[{ts}] {msg}',
+                            ('err',) if error else ('info',))
+        self._trim_log()
         self.log_box.see('end')
         self.log_box.config(state='disabled')
 
-    def _append_decoded(self, char):
-        """Append a PECHO-decoded character inline in the log."""
+    def _trim_log(self):
+        """Keep the log widget bounded so Tk text ops stay O(1) over time.
+
+        Checked only every 50th insert — index('end') itself isn't free —
+        and trims the oldest 100 lines once the widget passes 600.
+        Caller holds the widget in 'normal' state.
+        """
+        self._inserts_since_trim += 1
+        if self._inserts_since_trim < 50:
+            return
+        self._inserts_since_trim = 0
+        if int(self.log_box.index('end-1c').split('.')[0]) > 600:
+            self.log_box.delete('1.0', '100.end +1c')
+
+    def _flush_decoded(self):
+        """Append all pending PECHO-decoded characters in one insert.
+
+        Pops exactly the elements counted up front — the reader thread may
+        keep appending while we drain, and joining a deque it is mutating
+        would raise.
+        """
+        pending = self._log_pending
+        text = ''.join(pending.popleft() for _ in range(len(pending)))
         self.log_box.config(state='normal')
-        self.log_box.insert('end', ' ' if char == ' ' else char, ('dec',))
-        self.log_box.tag_config('dec', foreground=self.GREEN,
-                                font=('Consolas', 11, 'bold'))
+        self.log_box.insert('end', text, ('dec',))
+        self._trim_log()
         self.log_box.see('end')
         self.log_box.config(state='disabled')
 
@@ -520,14 +928,14 @@ class WKLink(tk.Tk):
     def _apply_sidetone(self):
         if not self.connected or not self.serial_port:
             return
-        val = 0x00 if self.mute_sidetone.get() else 0x04
-        self.serial_port.write(bytes([WK_SET_SIDETONE, val]))
+        self.serial_port.write(WK_FRAME_TONE_MUTE if self.mute_sidetone.get()
+                               else WK_FRAME_TONE_1KHZ)
 
     def _apply_swap(self):
         if not self.connected or not self.serial_port:
             return
-        mode = WK_MODE_SWAP if self.swap_paddles.get() else WK_MODE_BASE
-        self.serial_port.write(bytes([WK_SET_MODE_CMD, mode]))
+        self.serial_port.write(WK_FRAME_MODE_SWAP if self.swap_paddles.get()
+                               else WK_FRAME_MODE_BASE)
 
     def _on_close(self):
         if self.connected: